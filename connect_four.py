@@ -1,4 +1,12 @@
 import sys
+from collections import defaultdict, deque
+
+# Byte value stored in the board grid for an empty slot.
+EMPTY = ord(" ")
+# Byte padding the edges of the board grid, which no player symbol can match.
+SENTINEL = b"\x00"
+
+
 def gravity_decorator(insert_method):
     """Decorator to apply gravity to the game board after piece is placed.
     Makes pieces fall into the lowest available position after bomb or teleport.
@@ -7,30 +15,78 @@ def gravity_decorator(insert_method):
     Returns:
         A wrapper function that does the original insertion then applies gravity.
     """
-    def wrapper(self, board, column):
-        insertion = insert_method(self, board, column)
-        moved = True
-        while moved == True:
-            moved = False
-            # Iterate through board column by column and row from second last to the top
-            for column in range(board.columns):
-                for row in range(board.rows - 2, -1, -1):
-                    if (
-                        board.grid[row][column] != " "
-                        and board.grid[row + 1][column] == " "
-                    ):
-                        # Move the piece down as the row below was empty and empty the space
-                        board.grid[row + 1][column] = board.grid[row][column]
-                        board.grid[row][column] = " "
-                        moved = True
+    def wrapper(self, board, column_i0):
+        insertion = insert_method(self, board, column_i0)
+        grid = board.grid
+        rows = board.rows
+        columns = board.columns
+        stride = board.stride
+        set_slot = board.set
+
+        end = (rows + 1) * stride
+
+        # Compact each column in a single pass, keeping the pieces in order
+        for column in range(columns):
+            # Read the whole column with one extended slice of the grid
+            current = grid[stride + column:end:stride]
+            pieces = current.replace(b" ", b"")
+            # The column is already settled when all its pieces sit at the bottom
+            if current.endswith(pieces):
+                continue
+
+            # Rows above the settled pieces are emptied, only rewriting slots that change
+            settled = b" " * (rows - len(pieces)) + pieces
+            for row in range(rows):
+                if current[row] != settled[row]:
+                    set_slot(row, column, settled[row])
         return insertion
 
     return wrapper
 
 
+def check_win(grid: bytearray, stride: int, index: int, symbol: int) -> bool:
+    """Checks whether the slot at the given index is part of four in a row.
+    Counts consecutive matching slots outwards from the slot in the
+    horizontal, vertical and both diagonal directions, each given by the
+    index step between neighbouring slots in that direction. The grid is
+    surrounded by sentinel slots, so every walk stops at the edge of the board
+    on the symbol comparison alone without any bounds checks.
+    Args:
+        grid: the padded flat grid of the board.
+        stride: the number of slots in one padded row of the grid.
+        index: the index of the slot to check from.
+        symbol: the byte value of the symbol to connect.
+    Returns:
+        True if four or more slots are connected in any direction, otherwise False.
+    """
+    # Steps between neighbouring slots horizontally, vertically, in "\" and in "/".
+    for step in (1, stride, stride + 1, stride - 1):
+        counter = 1
+
+        # Count consecutive pieces backwards and then forwards along the direction.
+        check = index - step
+        while grid[check] == symbol:
+            counter += 1
+            check -= step
+
+        check = index + step
+        while grid[check] == symbol:
+            counter += 1
+            check += step
+
+        if counter >= 4:
+            return True
+
+    return False
+
+
 class Board:
     """Make a connect-four game board with a given number of rows and columns.
-    This class manages the grid structure and its display
+    This class manages the grid structure and its display.
+    The grid is stored as a flat bytearray in row-major order, with each slot
+    holding the byte value of the symbol occupying it. The grid is padded with
+    a row of sentinel slots above and below and a sentinel column after each
+    row, so scans that walk off the board stop on a slot no symbol can match.
     """
 
     def __init__(self, rows: int, columns: int):
@@ -41,14 +97,72 @@ class Board:
         """
         self.rows = rows
         self.columns = columns
-        self.grid = []
+        # Each padded row holds the columns followed by one sentinel slot.
+        self.stride = columns + 1
+        self.grid = bytearray(SENTINEL * ((rows + 2) * self.stride))
+        for row in range(rows):
+            self.grid[self.index(row, 0):self.index(row, columns)] = b" " * columns
+        # Slots a symbol has been written to since the list was last cleared.
+        self.changed = []
+        # Number of slots currently holding a piece.
+        self.filled = 0
+
+        # Construct column header with numbers, with proper alignment.
+        # The header and border only depend on the columns, so build them once.
+        numbers = " ".join(
+            str(column_num).center(3) for column_num in range(1, self.columns + 1)
+        )
+        # Remove trailing padding of the last number and add newline for formatting.
+        self._header = (" " + numbers).rstrip() + "\n"
+        self._hborder = "+" + "---+" * self.columns + "\n"
+
+    def index(self, row: int, column: int) -> int:
+        """Returns the index of the given slot in the padded grid.
+        Args:
+            row: the row of the slot.
+            column: the zero-based column of the slot.
+        """
+        return (row + 1) * self.stride + column
 
-        # Creating the grid as a list of lists, by going row by row.
-        for row in range(self.rows):
-            row = []
-            for column in range(self.columns):
-                row.append(" ")
-            self.grid.append(row)
+    def get(self, row: int, column: int) -> int:
+        """Returns the byte value stored at the given slot.
+        Args:
+            row: the row of the slot.
+            column: the zero-based column of the slot.
+        """
+        return self.grid[(row + 1) * self.stride + column]
+
+    def set(self, row: int, column: int, value: int):
+        """Stores a byte value at the given slot.
+        Args:
+            row: the row of the slot.
+            column: the zero-based column of the slot.
+            value: the byte value of the symbol to store (EMPTY to clear it).
+        """
+        index = (row + 1) * self.stride + column
+        if self.grid[index] == EMPTY:
+            if value != EMPTY:
+                self.filled += 1
+        elif value == EMPTY:
+            self.filled -= 1
+        self.grid[index] = value
+        if value != EMPTY:
+            self.changed.append((row, column))
+
+    def clear_area(self, top: int, bottom: int, left: int, right: int):
+        """Empties every slot in a rectangle of the board.
+        Each row of the rectangle is cleared with one slice assignment.
+        Args:
+            top: the first row to clear.
+            bottom: the row after the last row to clear.
+            left: the first zero-based column to clear.
+            right: the column after the last column to clear.
+        """
+        width = right - left
+        for row in range(top, bottom):
+            start = (row + 1) * self.stride + left
+            self.filled -= width - self.grid.count(EMPTY, start, start + width)
+            self.grid[start:start + width] = b" " * width
 
     def __str__(self) -> str:
         """Returns the string representation of the board for display.
@@ -56,41 +170,16 @@ class Board:
         Includes number of columns at the top and a grid structure below.
         """
 
-        # Construct column header with numbers, with proper alignment.
-        numbered_column = " "
-        column_num_space = 3
-        for column_num in range(1, self.columns + 1):
-            centered_string = str(column_num).center(column_num_space)
-            numbered_column += centered_string
-            if column_num < self.columns:
-                numbered_column += " "
-        
-        # Remove trailing characters and add newline for formatting.
-        numbered_column = numbered_column.rstrip()
-        numbered_column += "\n"
-
-        horizontal_border = "+"
-        for i in range(self.columns):
-            horizontal_border += "---+"
-        horizontal_border += "\n"
-
-        # Assemble grid, building it row by row.
-        display = ""
-        for row in self.grid:
-            display += horizontal_border
-
-            middle_line = "|"
-            for space in row:
-                middle_line += f" {space} |"
-            middle_line += "\n"
-
-            display += middle_line
-
-        display += horizontal_border
+        # Assemble grid, building it row by row and joining the parts once at the end.
+        parts = [self._header]
+        append = parts.append
+        for start in range(self.stride, (self.rows + 1) * self.stride, self.stride):
+            append(self._hborder)
+            row = self.grid[start:start + self.columns].decode("ascii")
+            append("| " + " | ".join(row) + " |\n")
+        append(self._hborder)
 
-        output = numbered_column + display
-
-        return output
+        return "".join(parts)
 
 
 class Piece:
@@ -104,29 +193,29 @@ class Piece:
             symbol: character representing the piece.
         """
         self.symbol = symbol
+        # Byte value of the symbol, as stored in the board grid.
+        self.symbol_b = ord(symbol)
 
-    def insert(self, board, column: int):
+    def insert(self, board, column_i0: int) -> int:
         """Places the piece into the specified column of the board.
         The piece is placed in the lowest available row.
         Args:
             board: the board the piece needs to be inserted in.
-            column: the column the piece needs to be inserted in.
+            column_i0: the zero-based column the piece needs to be inserted in.
         Returns:
-            True if piece was successfully inserted or false if not
+            The row the piece was inserted into, or -1 if it was not inserted
             (columns is out of bounds or full).
         """
 
-        column_i0 = column - 1
-
         if not (0 <= column_i0 < board.columns):
-            return False
+            return -1
 
         # Iterate from bottom to top, to find the first empty slot (whitespace).
         for row in range(board.rows - 1, -1, -1):
-            if board.grid[row][column_i0] == " ":
-                board.grid[row][column_i0] = self.symbol
-                return True
-        return False
+            if board.get(row, column_i0) == EMPTY:
+                board.set(row, column_i0, self.symbol_b)
+                return row
+        return -1
 
 
 class Player:
@@ -143,7 +232,11 @@ class Player:
 
         self.name = name
         self.symbol = symbol
-        self.pieces = []
+        # Byte value of the symbol, as stored in the board grid.
+        self.symbol_b = ord(symbol)
+        # Pieces are kept in a queue per symbol, with a running total of all pieces.
+        self.pieces_by_symbol = defaultdict(deque)
+        self.n_pieces = 0
 
     def add_piece(self, symbol, quantity):
         """Adds new piece objects to player's collection.
@@ -158,7 +251,8 @@ class Player:
                 piece = TeleportPiece()
             else:
                 piece = Piece(symbol)
-            self.pieces.append(piece)
+            self.pieces_by_symbol[symbol].append(piece)
+        self.n_pieces += quantity
 
     def __str__(self):
         """Return a string representation of the player's hand.
@@ -166,19 +260,12 @@ class Player:
         The string groups pieces by their symbol and reflects the count for each.
         """
 
-        # Count the number of each unique piece symbol in player's hand.
-        counter = {}
-        for piece in self.pieces:
-            symbol = piece.symbol
-            if symbol in counter:
-                counter[symbol] += 1
-            else:
-                counter[symbol] = 1
-        
-        # Format counter into a list of strings
+        # Format the count of each symbol still in player's hand into a list of strings
         strings = []
-        for key in sorted(counter.keys()):
-            strings.append(f"{key}: {counter[key]}")
+        for key in sorted(self.pieces_by_symbol):
+            count = len(self.pieces_by_symbol[key])
+            if count > 0:
+                strings.append(f"{key}: {count}")
 
         output_str = f"{self.name}'s pieces -> "
         output_str += ", ".join(strings)
@@ -188,11 +275,14 @@ class Player:
     def choose_piece(self):
         """Prompts the user to choose a piece and a column to play.
         Returns:
-            A list containing the removed piece object(the chosen piece) and the column,
-            or None is the input was invalid or the piece was not found.
+            A list containing the removed piece object(the chosen piece) and the
+            zero-based column, or None is the input was invalid or the piece was
+            not found.
         """
-        print(Player.__str__(self))
-        user_input = input("Choose a piece to play (symbol and column): ")
+        # The hand is shown as part of the prompt so it is written out together.
+        user_input = input(
+            f"{Player.__str__(self)}\nChoose a piece to play (symbol and column): "
+        )
 
         split = user_input.split(" ")
         if len(split) != 2:
@@ -200,16 +290,16 @@ class Player:
 
         chosen = split[0]
         try:
-            column = int(split[1])
+            column_i0 = int(split[1]) - 1
         except:
             return None
 
-        # Search for player's chosen piece in their collection and remove it.
-        for i in range(len(self.pieces)):
-            if self.pieces[i].symbol == chosen:
-                removed_piece = self.pieces.pop(i)
-                return [removed_piece, column]
-        return None
+        # Take the player's chosen piece from the queue for its symbol.
+        pieces = self.pieces_by_symbol.get(chosen)
+        if not pieces:
+            return None
+        self.n_pieces -= 1
+        return [pieces.popleft(), column_i0]
 
 
 class Game:
@@ -227,7 +317,8 @@ class Game:
         self.columns = columns
         self.board = Board(self.rows, self.columns)
         self.players = []
-        self.current_player = None
+        # Index of the player whose turn it is, the opponent is at current_idx ^ 1.
+        self.current_idx = 0
 
     def setup(self):
         """Sets up the game by creating player objects and distributing pieces.
@@ -241,7 +332,12 @@ class Game:
         while inputting:
             player1 = input("Enter player one's name and symbol: ")
             current = player1.split(" ")
-            if len(current) == 2 and len(current[1]) == 1:
+            if (
+                len(current) == 2
+                and len(current[1]) == 1
+                and current[1].isascii()
+                and current[1].isprintable()
+            ):
                 parts1 = current
                 break
         
@@ -252,6 +348,8 @@ class Game:
                 len(parts2) == 2
                 and parts2[1] != parts1[1]
                 and len(parts2[1]) == 1
+                and parts2[1].isascii()
+                and parts2[1].isprintable()
             ):
                 break
 
@@ -282,270 +380,91 @@ class Game:
         player2.add_piece("B", bomb_total)
 
         # Set player 1 as starting
-        self.current_player = self.players[0]
+        self.current_idx = 0
 
     def begin(self):
         """Starts and manages the main game loop."""
 
         self.setup()
-        print(self.board)
+        sys.stdout.write(f"{self.board}\n")
         playing = True
 
         while playing:
             
             # Determine other player for simulatenous win checks.
-            otherplayer = None
-            if self.players[0] == self.current_player:
-                otherplayer = self.players[1]
-            else:
-                otherplayer = self.players[0]
-            otherplayer_symbol = otherplayer.symbol
+            current_player = self.players[self.current_idx]
+            otherplayer = self.players[self.current_idx ^ 1]
+            otherplayer_symbol = otherplayer.symbol_b
 
             # If one player runs out of pieces before game end we let the ohter player play on
-            if len(self.current_player.pieces) == 0:
-                print(f"{self.current_player.name} out of pieces")
-                self.current_player = otherplayer
-                print(self.board)
+            if current_player.n_pieces == 0:
+                self.current_idx ^= 1
+                sys.stdout.write(f"{current_player.name} out of pieces\n{self.board}\n")
                 continue
             
             # Get the current player's chosen piece and column
-            userlist = self.current_player.choose_piece()
+            userlist = current_player.choose_piece()
             if userlist == None:
                 continue
 
             piece = userlist[0]
-            column = userlist[1]
-            column_i0 = column - 1
+            column_i0 = userlist[1]
+            current_symbol = current_player.symbol_b
 
-            insert_success = piece.insert(self.board, int(column))
-            if insert_success == False:
+            self.board.changed.clear()
+            inserted_row = piece.insert(self.board, column_i0)
+            if inserted_row < 0:
                 continue
 
-            # Determine the exact row the piece was inserted into.
-            inserted_row = -1
-            for row in range(self.board.rows):
-                if self.board.grid[row][column_i0] == piece.symbol:
-                    inserted_row = row
-                    break
-                else:
-                    continue
-
-
             # ----- Win conditions -----
+            # Only slots written during this move can complete a new line, which
+            # also catches simulatenous wins (draw) in case of flow-on effects.
+            grid = self.board.grid
+            stride = self.board.stride
             current_player_wins = None
-            # Check for horizontal win by connecting consecutive pieces in left or right order.
-            counter_h = 1
-            
-            column_index = column_i0 + -1
-            while (
-                column_index >= 0
-                and self.board.grid[inserted_row][column_index] == piece.symbol
-            ):
-                counter_h += 1
-                column_index -= 1
-
-            column_index = column_i0 + 1
-            while (
-                column_index < self.board.columns
-                and self.board.grid[inserted_row][column_index] == piece.symbol
-            ):
-                counter_h += 1
-                column_index += 1
-
-            if counter_h >= 4:
-                current_player_wins = True
-
-            # Check for win condition in "\" direction (top left or bottom right)
-            counter_d_backslash = 1
-
-            check_row = inserted_row - 1
-            check_column = column_i0 - 1
-            while (
-                check_row >= 0
-                and check_column >= 0
-                and self.board.grid[check_row][check_column] == piece.symbol
-            ):
-                check_row -= 1
-                check_column -= 1
-                counter_d_backslash += 1
-
-            check_row = inserted_row + 1
-            check_column = column_i0 + 1
-            while (
-                check_row < self.board.rows
-                and check_column < self.board.columns
-                and self.board.grid[check_row][check_column] == piece.symbol
-            ):
-                check_row += 1
-                check_column += 1
-                counter_d_backslash += 1
-
-            # Check for win condition in "/" direction (top right or bottom left)
-            counter_d_slash = 1
-
-            check_row = inserted_row - 1
-            check_column = column_i0 + 1
-            while (
-                check_row >= 0
-                and check_column < self.board.columns
-                and self.board.grid[check_row][check_column] == piece.symbol
-            ):
-                check_row -= 1
-                check_column += 1
-                counter_d_slash += 1
-            
-            check_row = inserted_row + 1
-            check_column = column_i0 - 1
-            while (
-                check_row < self.board.rows
-                and check_column >= 0
-                and self.board.grid[check_row][check_column] == piece.symbol
-            ):
-                check_row += 1
-                check_column -= 1
-                counter_d_slash += 1
-
-            if counter_d_backslash >= 4:
-                current_player_wins = True
-
-            if counter_d_slash >= 4:
-                current_player_wins = True
-
-            # Check for vertical win by consecutive pieces in up or down direction.
-            counter_v = 1
-            
-            vertical_row = inserted_row - 1
-            while (
-                vertical_row >= 0
-                and self.board.grid[vertical_row][column_i0] == piece.symbol
-            ):
-                vertical_row -= 1
-                counter_v += 1
-
-            Down_row = inserted_row + 1
-            while (
-                Down_row < self.board.rows
-                and self.board.grid[Down_row][column_i0] == piece.symbol
-            ):
-                Down_row += 1
-                counter_v += 1
-
-            if counter_v >= 4:
-                current_player_wins = True
-
-            # Detect simulatenous wins (draw) in case of flow-on effects.
             otherplayer_wins = None
-            for row in range(self.board.rows):
-                for column in range(self.board.columns):
-                    if self.board.grid[row][column] == otherplayer_symbol:
-
-                        # Check for horizontal win for other player
-                        horizontal_count = 1
-                        for x in range(1, 4):
-                            if (
-                                column + x < self.board.columns
-                                and self.board.grid[row][column + x]
-                                == otherplayer_symbol
-                            ):
-                                horizontal_count += 1
-                            else:
-                                break
-                        if horizontal_count >= 4:
-                            otherplayer_wins = True
-                            break
-
-                        # Check for vertical win for other player
-                        vertical_count = 1
-                        for x in range(1, 4):
-                            if (
-                                row + x < self.board.rows
-                                and self.board.grid[row + x][column]
-                                == otherplayer_symbol
-                            ):
-                                vertical_count += 1
-                            else:
-                                break
-                        if vertical_count >= 4:
-                            otherplayer_wins = True
-                            break
-
-                        # Check for diagonal (bottom right) win for other player
-                        bottom_right = 1
-                        for x in range(1, 4):
-                            if (
-                                row + x < self.board.rows
-                                and column + x < self.board.columns
-                                and self.board.grid[row + x][column + x]
-                                == otherplayer_symbol
-                            ):
-                                bottom_right += 1
-                            else:
-                                break
-                        if bottom_right >= 4:
-                            otherplayer_wins = True
-                            break
-
-                        # Check for diagonal (bottom left) win for other player
-                        bottom_left = 1
-                        for x in range(1, 4):
-                            if (
-                                row + x < self.board.rows
-                                and column - x >= 0
-                                and self.board.grid[row + x][column - x]
-                                == otherplayer_symbol
-                            ):
-                                bottom_left += 1
-                            else:
-                                break
-                        if bottom_left >= 4:
-                            otherplayer_wins = True
-                            break
-                if otherplayer_wins == True:
-                    break
+            for row, column in self.board.changed:
+                index = (row + 1) * stride + column
+                slot = grid[index]
+                if slot == current_symbol and not current_player_wins:
+                    current_player_wins = check_win(grid, stride, index, current_symbol)
+                elif slot == otherplayer_symbol and not otherplayer_wins:
+                    otherplayer_wins = check_win(grid, stride, index, otherplayer_symbol)
 
             # Determine game outcome based on detected wins.
             if current_player_wins == True and otherplayer_wins == True:
-                print("It was a draw!")
-                print(self.board)
+                sys.stdout.write(f"It was a draw!\n{self.board}\n")
                 playing = False
                 continue
             
             elif current_player_wins == True:
-                print(f"{self.current_player.name} wins!")
-                print(self.board)
+                sys.stdout.write(f"{current_player.name} wins!\n{self.board}\n")
                 playing = False
                 continue
             
             elif otherplayer_wins == True:
-                print(f"{self.current_player.name} wins!")
-                print(self.board)
+                sys.stdout.write(f"{current_player.name} wins!\n{self.board}\n")
                 playing = False
                 continue
             
             # Draw if board is completely full (no whitespace slots).
-            board_is_full = True
-            for row in self.board.grid:
-                for slot in row:
-                    if slot == " ":
-                        board_is_full = False
-                        break
+            board_is_full = self.board.filled == self.rows * self.columns
 
             # Draw if players out of pieces
             no_more_pieces = False
-            if len(self.players[0].pieces) == 0 and len(self.players[1].pieces) == 0:
+            if self.players[0].n_pieces == 0 and self.players[1].n_pieces == 0:
                 no_more_pieces = True
 
             if board_is_full == True or no_more_pieces == True:
-                print("It was a draw!")
-                print(self.board)
+                sys.stdout.write(f"It was a draw!\n{self.board}\n")
                 playing = False
                 continue
             
 
-            print(self.board)
+            sys.stdout.write(f"{self.board}\n")
             
             # Switch players for next turn
-            self.current_player = otherplayer
+            self.current_idx ^= 1
 
 
 class BombPiece(Piece):
@@ -557,36 +476,28 @@ class BombPiece(Piece):
         super().__init__("B")
 
     @gravity_decorator
-    def insert(self, board, column):
+    def insert(self, board, column_i0):
         """Insert bomb piece and detonate it.
         Args:
             board: The board the piece is inserted in.
-            column: The column the piece is inserted in.
+            column_i0: The zero-based column the piece is inserted in.
         Returns:
-            boolean value: True or False if bomb detonated or not
+            The row the bomb detonated in, or -1 if it was not inserted.
         """
         
-        inserted = super().insert(board, column)
-        if inserted == False:
-            return False
-        inserted_row = -1
-        column_i0 = column - 1
-        
-        # Find exact row the bomb was placed in to center the explosion
-        for row in range(board.rows - 1, -1, -1):
-            if board.grid[row][column_i0] == self.symbol:
-                inserted_row = row
-                break
+        # The row the bomb landed in is the center of the explosion
+        inserted_row = super().insert(board, column_i0)
+        if inserted_row < 0:
+            return -1
         
-        # Clear each cell in the radius and ignore out of bounds cells
-        for row in range(-1, 2):
-            for column in range(-1, 2):
-                target_row = inserted_row + row
-                target_column = column_i0 + column
-
-                if 0 <= target_row < board.rows and 0 <= target_column < board.columns:
-                    board.grid[target_row][target_column] = " "
-        return True
+        # Clear each cell in the radius, clipping the area to the board's bounds
+        board.clear_area(
+            max(0, inserted_row - 1),
+            min(board.rows, inserted_row + 2),
+            max(0, column_i0 - 1),
+            min(board.columns, column_i0 + 2),
+        )
+        return inserted_row
 
 
 class TeleportPiece(Piece):
@@ -599,30 +510,22 @@ class TeleportPiece(Piece):
         super().__init__("T")
 
     @gravity_decorator
-    def insert(self, board, column):
+    def insert(self, board, column_i0):
         """Insert the teleport piece, move the mirrored piece and apply gravity.
         Args:
             board: The board the piece is inserted in.
-            column: The column the piece is inserted in.
+            column_i0: The zero-based column the piece is inserted in.
         Returns:
-            boolean value: True or False if teleported or not
+            The row the "T" piece landed in, or -1 if it was not inserted.
         """
         
-        inserted = super().insert(board, column)
-
-        if inserted == False:
-            return False
+        inserted_row = super().insert(board, column_i0)
 
-        #Find the exact row where the "T" piece landed
-        inserted_row = -1
-        column_i0 = column - 1
-        for row in range(board.rows - 1, -1, -1):
-            if board.grid[row][column_i0] == self.symbol:
-                inserted_row = row
-                break
+        if inserted_row < 0:
+            return -1
         
         # Remove the "T"
-        board.grid[inserted_row][column_i0] = " "
+        board.set(inserted_row, column_i0, EMPTY)
         
         # Calculate mirrored row and column based on the board's center
         center_row = (board.rows - 1) / 2
@@ -635,21 +538,21 @@ class TeleportPiece(Piece):
         
         if 0 <= mirrored_row < board.rows and 0 <= mirrored_column < board.columns:
             # If within bounds get symbol from mirrored position
-            targetted_symbol_mirroredposition = board.grid[mirrored_row][mirrored_column]
+            targetted_symbol_mirroredposition = board.get(mirrored_row, mirrored_column)
 
             # If there is a piece at mirrored position, move it and remove from original slot.
-            if targetted_symbol_mirroredposition != " ":
+            if targetted_symbol_mirroredposition != EMPTY:
                 symbol_to_teleport = targetted_symbol_mirroredposition
-                board.grid[mirrored_row][mirrored_column] = " "
+                board.set(mirrored_row, mirrored_column, EMPTY)
 
         # If piece was found and removed, find the lowest spot and place teleported symbol
         if symbol_to_teleport != None:
             for row in range(board.rows - 1, -1, -1):
-                if board.grid[row][column_i0] == " ":
-                    board.grid[row][column_i0] = symbol_to_teleport
+                if board.get(row, column_i0) == EMPTY:
+                    board.set(row, column_i0, symbol_to_teleport)
                     break
         
-        return True
+        return inserted_row
 
 def main():
     "Command-line interface for players"